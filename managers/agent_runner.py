@@ -6,7 +6,7 @@ import openai
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from utils.logger import Logger
-from managers.agents_manager import AgentsManager
+from managers.agents_manager import AgentsManager, AGENT_TYPES
 from managers.objective_manager import ObjectiveManager
 from managers.aider_manager import AiderManager
 
@@ -14,8 +14,24 @@ from managers.aider_manager import AiderManager
 DEFAULT_MODEL = "gpt-4o-mini"
 DEFAULT_AGENT_COUNT = 10
 AGENT_START_DELAY = 10  # seconds between agent starts
+AGENT_WAIT_TIMEOUT = 30  # max seconds to wait for an agent to be released
+AGENT_RETRY_DELAY = 3  # seconds before replacing an agent whose cycle failed
 DEFAULT_MISSION_FILE = ".aider.mission.md"
 
+# Emoji shown for each agent type
+AGENT_EMOJIS = {
+    'specification': '📌',
+    'management': '🧭',
+    'writing': '✍️',
+    'evaluation': '⚖️',
+    'deduplication': '👥',
+    'chronicler': '📜',
+    'redundancy': '🎭',
+    'production': '🏭',
+    'researcher': '🔬',
+    'integration': '🌐' 
+}
+
 class AgentRunner:
     """Runner class for executing and managing agent operations.
     
@@ -29,7 +45,7 @@ class AgentRunner:
         objective_manager (ObjectiveManager): Manager for agent objectives
         aider_manager (AiderManager): Manager for aider operations
         _active_agents (set): Set of currently active agent names
-        _agent_lock (asyncio.Lock): Lock for synchronizing agent operations
+        _agent_released (asyncio.Event): Set whenever an active agent is released
     """
     
     def __init__(self, model="gpt-4o-mini"):
@@ -39,7 +55,7 @@ class AgentRunner:
         self.objective_manager = ObjectiveManager(model=model)
         self.aider_manager = AiderManager(model=model)
         self._active_agents = set()  # Track active agents
-        self._agent_lock = asyncio.Lock()  # Use asyncio.Lock for async operations
+        self._agent_released = asyncio.Event()  # Wakes cycles waiting for a free agent
         self.model = model
 
     def _validate_mission_file(self, mission_filepath):
@@ -112,13 +128,17 @@ class AgentRunner:
             if not available_agents:
                 raise ValueError("No agents available to run")
                 
-            # Create initial tasks up to agent_count
+            # Create initial tasks up to agent_count, all at once. Each task
+            # staggers its own start so the delays run in parallel instead of
+            # holding up the launcher
             for i in range(min(agent_count, len(available_agents))):
                 task = asyncio.create_task(
-                    self._run_single_agent_cycle(mission_filepath, model)
+                    self._run_single_agent_cycle(
+                        mission_filepath, model,
+                        start_delay=i * AGENT_START_DELAY
+                    )
                 )
                 tasks.add(task)
-                await asyncio.sleep(10)  # 10 second delay between each start
 
             if not tasks:
                 raise ValueError("No tasks could be created")
@@ -128,21 +148,27 @@ class AgentRunner:
                 # Wait for an agent to complete
                 done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
                 
+                # Refresh available agents list once per wakeup
+                available_agents = self._get_available_agents()
+                
                 # Handle completed agents
                 for task in done:
+                    failed = False
                     try:
                         await task  # Get potential errors
                     except Exception as e:
                         self.logger.error(f"Agent task failed: {str(e)}")
+                        failed = True
                     
-                    # Refresh available agents list
-                    available_agents = self._get_available_agents()
-                    
-                    # Create new agent to replace completed one
+                    # Create new agent to replace completed one. A failed cycle
+                    # is retried after a delay so persistent errors (bad key,
+                    # network down, quota) don't spin through cycles
                     if len(pending) < agent_count and available_agents:
-                        await asyncio.sleep(3)  # Delay before starting new agent
                         new_task = asyncio.create_task(
-                            self._run_single_agent_cycle(mission_filepath, model)
+                            self._run_single_agent_cycle(
+                                mission_filepath, model,
+                                start_delay=AGENT_RETRY_DELAY if failed else 0
+                            )
                         )
                         pending.add(new_task)
                         self.logger.info(f"🔄 Replaced completed agent. Active agents: {len(pending)}/{agent_count}")
@@ -158,19 +184,7 @@ class AgentRunner:
             
     def _get_agent_emoji(self, agent_type):
         """Get the appropriate emoji for an agent type."""
-        agent_emojis = {
-            'specification': '📌',
-            'management': '🧭',
-            'writing': '✍️',
-            'evaluation': '⚖️',
-            'deduplication': '👥',
-            'chronicler': '📜',
-            'redundancy': '🎭',
-            'production': '🏭',
-            'researcher': '🔬',
-            'integration': '🌐' 
-        }
-        return agent_emojis.get(agent_type, '🤖')
+        return AGENT_EMOJIS.get(agent_type, '🤖')
 
     def _agents_exist(self, force_regenerate=False):
         """
@@ -182,41 +196,27 @@ class AgentRunner:
         Returns:
             list: List of agent types to generate/regenerate
         """
-        agent_types = [
-            "specification",
-            "management", 
-            "writing",
-            "evaluation",
-            "deduplication",
-            "chronicler",
-            "redundancy",
-            "production",
-            "researcher",
-            "integration"
-        ]
-        
         if force_regenerate:
-            return agent_types
+            return list(AGENT_TYPES)
             
-        missing_agents = []
-        for agent_type in agent_types:
-            if not os.path.exists(f".aider.agent.{agent_type}.md"):
-                missing_agents.append(agent_type)
-                
-        return missing_agents
+        agent_files = self._get_agent_files()
+        return [agent_type for agent_type in AGENT_TYPES
+                if f".aider.agent.{agent_type}.md" not in agent_files]
         
-    async def _run_single_agent_cycle(self, mission_filepath, model="gpt-4o-mini"):
-        """Execute a single cycle for one agent."""
+    async def _run_single_agent_cycle(self, mission_filepath, model="gpt-4o-mini", start_delay=0):
+        """Execute a single cycle for one agent, optionally after start_delay seconds."""
         agent_name = None
         try:
-            # Select an unused agent
-            agent_name = await self._select_available_agent()
+            if start_delay:
+                await asyncio.sleep(start_delay)
+                
+            # Select an unused agent, waiting for one to be released if needed
+            agent_name = await self._wait_for_available_agent()
             if not agent_name:
-                await asyncio.sleep(1)  # Wait if no agent available
                 return
             
-            start_time = time.time()
-            self.logger.info(f"🕐 Agent {agent_name} starting cycle at {start_time}")
+            start_time = time.monotonic()
+            self.logger.info(f"🕐 Agent {agent_name} starting cycle at {time.strftime('%H:%M:%S')}")
             
             # Execute agent cycle - now properly awaited
             await self._execute_agent_cycle(
@@ -225,8 +225,7 @@ class AgentRunner:
                 model
             )
             
-            end_time = time.time()
-            duration = end_time - start_time
+            duration = time.monotonic() - start_time
             self.logger.info(f"⏱️ Agent {agent_name} completed cycle in {duration:.2f} seconds")
             
         except Exception as e:
@@ -235,33 +234,61 @@ class AgentRunner:
             
         finally:
             # Always release agent if it was acquired
-            if agent_name:
-                async with self._agent_lock:
-                    if agent_name in self._active_agents:
-                        self._active_agents.remove(agent_name)
+            if agent_name in self._active_agents:
+                self._active_agents.remove(agent_name)
+                self._agent_released.set()
 
     async def _select_available_agent(self):
-        """Select an unused agent in a thread-safe way.
-        
-        This method ensures proper synchronization when selecting agents
-        to prevent race conditions in parallel execution.
+        """Select an unused agent and mark it active.
         
         Returns:
             str: Name of selected agent, or None if no agents available
             
         Thread Safety:
-            This method uses asyncio.Lock for thread-safe agent selection
+            All agent cycles run on the same event loop and this method never
+            awaits between checking and claiming an agent, so the selection is
+            atomic without a lock
         """
-        async with self._agent_lock:
-            available_agents = self._get_available_agents()
-            unused_agents = [a for a in available_agents if a not in self._active_agents]
+        available_agents = self._get_available_agents()
+        unused_agents = [a for a in available_agents if a not in self._active_agents]
+        
+        if not unused_agents:
+            return None
             
-            if not unused_agents:
+        agent_name = random.choice(unused_agents)
+        self._active_agents.add(agent_name)
+        return agent_name
+
+    async def _wait_for_available_agent(self, timeout=AGENT_WAIT_TIMEOUT):
+        """Select an unused agent, waiting for a release if all are busy.
+        
+        Instead of polling, the cycle sleeps on the release event and only
+        retries selection once another cycle has freed an agent.
+        
+        Args:
+            timeout (float): Maximum number of seconds to wait
+            
+        Returns:
+            str: Name of selected agent, or None if none was released in time
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        
+        agent_name = await self._select_available_agent()
+        while not agent_name:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
                 return None
                 
-            agent_name = random.choice(unused_agents)
-            self._active_agents.add(agent_name)
-            return agent_name
+            self._agent_released.clear()
+            try:
+                await asyncio.wait_for(self._agent_released.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+                
+            agent_name = await self._select_available_agent()
+            
+        return agent_name
             
     def _get_folder_context(self, folder_path: str, files: list, subfolders: list, mission_content: str) -> dict:
         """
@@ -413,21 +440,18 @@ class AgentRunner:
 
     def _get_available_agents(self):
         """List available agents."""
-        agent_types = [
-            "specification",
-            "management", 
-            "writing",
-            "evaluation",
-            "deduplication",
-            "chronicler",
-            "redundancy",
-            "production",
-            "researcher",
-            "integration"
-        ]
+        agent_files = self._get_agent_files()
+        return [agent_type for agent_type in AGENT_TYPES 
+                if f".aider.agent.{agent_type}.md" in agent_files]
+
+    def _get_agent_files(self):
+        """Get the set of agent file names in the current folder.
         
-        return [agent_type for agent_type in agent_types 
-                if os.path.exists(f".aider.agent.{agent_type}.md")]
+        Uses a single directory scan instead of one exists() check per agent type.
+        """
+        with os.scandir('.') as entries:
+            return {entry.name for entry in entries
+                    if entry.name.startswith('.aider.agent.')}
         
     async def _execute_agent_cycle(self, agent_name, mission_filepath, model="gpt-4o-mini"):
         """Execute a single agent cycle."""
@@ -435,8 +459,11 @@ class AgentRunner:
             agent_filepath = f".aider.agent.{agent_name}.md"
             objective_filepath = f".aider.objective.{agent_name}.md"
             
-            # Generate objective directly since we're in a thread
-            self.objective_manager.generate_objective(
+            # Generate objective in the default executor so the blocking
+            # GPT call does not stall the other agents' event loop work
+            await asyncio.get_event_loop().run_in_executor(
+                None,
+                self.objective_manager.generate_objective,
                 mission_filepath,
                 agent_filepath
             )
@@ -453,10 +480,3 @@ class AgentRunner:
         except Exception as e:
             self.logger.error(f"Error in agent cycle for {agent_name}: {str(e)}")
             raise
-            
-        finally:
-            # Always release agent if it was acquired
-            if agent_name:
-                async with self._agent_lock:
-                    if agent_name in self._active_agents:
-                        self._active_agents.remove(agent_name)
@@ -6,6 +6,66 @@ from utils.logger import Logger
 import openai
 from dotenv import load_dotenv
 
+# List of specific agent types, shared by agent generation and the runner
+AGENT_TYPES = (
+    "specification",
+    "management", 
+    "writing",
+    "evaluation",
+    "deduplication",
+    "chronicler",
+    "redundancy",
+    "production",
+    "researcher",
+    "integration"
+)
+
+# System message sent with every agent configuration request
+AGENT_GENERATOR_SYSTEM_PROMPT = """
+# KinOS Agent Generator
+
+You create strategic role definitions for KinOS agents by applying specialized analysis frameworks.
+
+## Operational Context
+- Agent operates through Aider file operations
+- Main loop handles all triggers and timing
+- Single-step file modifications only
+- Directory-based mission scope
+
+## Framework Integration
+1. Question Analysis
+   - Process each framework section
+   - Extract relevant guidelines
+   - Apply to current context
+
+2. Role Mapping
+   - Map responsibilities to framework sections
+   - Align capabilities with framework requirements
+   - Define boundaries using framework structure
+
+3. Planning Through Framework
+   - Use framework sections as planning guides
+   - Ensure comprehensive coverage
+   - Maintain framework-aligned validation
+
+## Core Requirements
+1. Mission Contribution
+   - Framework-guided responsibilities
+   - Framework-aligned success metrics
+   - Quality standards from framework
+
+2. Team Integration
+   - Framework-based coordination
+   - Shared objective alignment
+   - Quality interdependencies
+
+Remember: 
+- Answer framework questions practically
+- Keep focus on achievable file operations
+- Use framework to structure planning
+- Maintain mission alignment
+"""
+
 class AgentsManager:
     """Manager class for handling agents and their operations."""
     
@@ -13,6 +73,7 @@ class AgentsManager:
         self.mission_path = None
         self.logger = Logger()
         self.model = model
+        self.prompts_dir = self._get_prompts_dir()  # Resolved once, shared by all agents
         load_dotenv()  # Load environment variables
         openai.api_key = os.getenv('OPENAI_API_KEY')
         if not openai.api_key:
@@ -37,27 +98,36 @@ class AgentsManager:
                 self.logger.info("\n📝 The mission file must contain your project description.")
                 raise SystemExit(1)
                 
-            # List of specific agent types
-            agent_types = [
-                "specification",
-                "management", 
-                "writing",
-                "evaluation",
-                "deduplication",
-                "chronicler",
-                "redundancy",
-                "production",
-                "researcher",
-                "integration"
-            ]
-            
-            # Create tasks for parallel execution
-            tasks = []
-            for agent_type in agent_types:
-                tasks.append(self._generate_single_agent_async(agent_type))
+            # One thread pool shared by all agents, sized so every agent's
+            # GPT call can run in parallel
+            pool = ThreadPoolExecutor(max_workers=len(AGENT_TYPES))
+            try:
+                # Load mission content once for all agents
+                mission_content = await asyncio.get_event_loop().run_in_executor(
+                    pool,
+                    self._read_mission_content
+                )
                 
-            # Execute all tasks in parallel and wait for completion
-            await asyncio.gather(*tasks)
+                # Create tasks for parallel execution
+                tasks = []
+                for agent_type in AGENT_TYPES:
+                    tasks.append(asyncio.ensure_future(self._generate_single_agent_async(
+                        agent_type, mission_content, pool
+                    )))
+                    
+                # Execute all tasks in parallel and wait for completion
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    # Stop the other agents; cancelling them also cancels
+                    # their executor calls that have not started yet
+                    for task in tasks:
+                        task.cancel()
+                    raise
+            finally:
+                # Don't block the event loop waiting for threads that are
+                # still running after a failure
+                pool.shutdown(wait=False)
             
         except Exception as e:
             self.logger.error(f"❌ Agent generation failed: {str(e)}")
@@ -76,43 +146,53 @@ class AgentsManager:
             self.logger.error(f"⚠️ Error validating mission file: {str(e)}")
             return False
         
-    async def _generate_single_agent_async(self, agent_name):
+    async def _generate_single_agent_async(self, agent_name, mission_content, pool=None):
         """
         Asynchronous version of _generate_single_agent.
+        
+        Blocking file and API calls run in the given executor, which is shared
+        by all agents being generated (the loop's default executor if None).
         """
         try:
-            # Use ThreadPoolExecutor for CPU-bound operations
-            with ThreadPoolExecutor() as pool:
-                # Load mission content
-                mission_content = await asyncio.get_event_loop().run_in_executor(
-                    pool,
-                    self._read_mission_content
-                )
-                
-                # Create agent prompt
-                prompt = self._create_agent_prompt(agent_name, mission_content)
-                self.logger.debug(f"📝 Created prompt for agent: {agent_name}")
-                
-                # Make GPT call and get response
-                agent_config = await asyncio.get_event_loop().run_in_executor(
-                    pool,
-                    lambda: self._call_gpt(prompt)
-                )
-                self.logger.debug(f"🤖 Received GPT response for agent: {agent_name}")
-                
-                # Save agent configuration
-                output_path = f".aider.agent.{agent_name}.md"
-                await asyncio.get_event_loop().run_in_executor(
-                    pool,
-                    lambda: self._save_agent_config(output_path, agent_config)
-                )
-                
-                self.logger.success(f"✨ Agent {agent_name} successfully generated")
+            loop = asyncio.get_event_loop()
+            
+            # Create agent prompt
+            prompt = self._create_agent_prompt(agent_name, mission_content)
+            self.logger.debug(f"📝 Created prompt for agent: {agent_name}")
+            
+            # Make GPT call and get response
+            agent_config = await loop.run_in_executor(
+                pool,
+                self._call_gpt,
+                prompt
+            )
+            self.logger.debug(f"🤖 Received GPT response for agent: {agent_name}")
+            
+            # Save agent configuration
+            output_path = f".aider.agent.{agent_name}.md"
+            await loop.run_in_executor(
+                pool,
+                self._save_agent_config,
+                output_path,
+                agent_config
+            )
+            
+            self.logger.success(f"✨ Agent {agent_name} successfully generated")
                 
         except Exception as e:
             self.logger.error(f"Failed to generate agent {agent_name}: {str(e)}")
             raise
 
+    def _get_prompts_dir(self):
+        """Get the prompts directory of the KinOS installation."""
+        if getattr(sys, 'frozen', False):
+            # If running as compiled executable
+            install_dir = os.path.dirname(sys.executable)
+        else:
+            # If running from source
+            install_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(install_dir, "prompts")
+
     def _read_mission_content(self):
         """Helper method to read mission content."""
         with open(self.mission_path, 'r') as f:
@@ -134,16 +214,8 @@ class AgentsManager:
         Returns:
             str: Detailed prompt for agent generation
         """
-        # Get the KinOS installation directory
-        if getattr(sys, 'frozen', False):
-            # If running as compiled executable
-            install_dir = os.path.dirname(sys.executable)
-        else:
-            # If running from source
-            install_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
         # Look for prompts in the installation directory
-        prompt_path = os.path.join(install_dir, "prompts", f"{agent_name}.md")
+        prompt_path = os.path.join(self.prompts_dir, f"{agent_name}.md")
         self.logger.debug(f"Looking for prompt at: {prompt_path}")
         
         custom_prompt = ""
@@ -227,50 +299,7 @@ Example Sections:
         try:
             self.logger.debug("\n🤖 AGENT CONFIGURATION PROMPT:")
             self.logger.debug("=== System Message ===")
-            self.logger.debug("""
-# KinOS Agent Generator
-
-You create strategic role definitions for KinOS agents by applying specialized analysis frameworks.
-
-## Operational Context
-- Agent operates through Aider file operations
-- Main loop handles all triggers and timing
-- Single-step file modifications only
-- Directory-based mission scope
-
-## Framework Integration
-1. Question Analysis
-   - Process each framework section
-   - Extract relevant guidelines
-   - Apply to current context
-
-2. Role Mapping
-   - Map responsibilities to framework sections
-   - Align capabilities with framework requirements
-   - Define boundaries using framework structure
-
-3. Planning Through Framework
-   - Use framework sections as planning guides
-   - Ensure comprehensive coverage
-   - Maintain framework-aligned validation
-
-## Core Requirements
-1. Mission Contribution
-   - Framework-guided responsibilities
-   - Framework-aligned success metrics
-   - Quality standards from framework
-
-2. Team Integration
-   - Framework-based coordination
-   - Shared objective alignment
-   - Quality interdependencies
-
-Remember: 
-- Answer framework questions practically
-- Keep focus on achievable file operations
-- Use framework to structure planning
-- Maintain mission alignment
-""")
+            self.logger.debug(AGENT_GENERATOR_SYSTEM_PROMPT)
             self.logger.debug("\n=== User Message ===")
             self.logger.debug(prompt)
 
@@ -278,50 +307,7 @@ Remember:
             response = client.chat.completions.create(
                 model="gpt-4o",  # Using the BIG Omni model!
                 messages=[
-                    {"role": "system", "content": """
-# KinOS Agent Generator
-
-You create strategic role definitions for KinOS agents by applying specialized analysis frameworks.
-
-## Operational Context
-- Agent operates through Aider file operations
-- Main loop handles all triggers and timing
-- Single-step file modifications only
-- Directory-based mission scope
-
-## Framework Integration
-1. Question Analysis
-   - Process each framework section
-   - Extract relevant guidelines
-   - Apply to current context
-
-2. Role Mapping
-   - Map responsibilities to framework sections
-   - Align capabilities with framework requirements
-   - Define boundaries using framework structure
-
-3. Planning Through Framework
-   - Use framework sections as planning guides
-   - Ensure comprehensive coverage
-   - Maintain framework-aligned validation
-
-## Core Requirements
-1. Mission Contribution
-   - Framework-guided responsibilities
-   - Framework-aligned success metrics
-   - Quality standards from framework
-
-2. Team Integration
-   - Framework-based coordination
-   - Shared objective alignment
-   - Quality interdependencies
-
-Remember: 
-- Answer framework questions practically
-- Keep focus on achievable file operations
-- Use framework to structure planning
-- Maintain mission alignment
-"""},
+                    {"role": "system", "content": AGENT_GENERATOR_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.4,
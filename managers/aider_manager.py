@@ -1,13 +1,16 @@
 import os
-import time
+import stat
 import json
 import asyncio
+import logging
 import subprocess
 from utils.logger import Logger
 from utils.fs_utils import FSUtils
 from utils.encoding_utils import EncodingUtils
 from pathlib import Path
-from managers.vision_manager import VisionManager
+
+# Vendored aider package, added to PYTHONPATH for aider subprocesses
+AIDER_VENDOR_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vendor', 'aider')
 
 class AiderManager:
     """Manager class for handling aider operations."""
@@ -15,8 +18,9 @@ class AiderManager:
     def __init__(self, model="gpt-4o-mini"):
         """Initialize the manager with logger."""
         self.logger = Logger(model=model)
-        self._vision_manager = VisionManager()
         self.encoding_utils = EncodingUtils()  # Add encoding utils
+        self.fs_utils = FSUtils()  # Shared instead of rebuilt per call
+        self._utf8_checked = {}  # filepath -> (mtime, size) last verified as UTF-8
         self.model = model
 
     def _validate_repo_visualizer(self):
@@ -59,12 +63,7 @@ class AiderManager:
                 raise ValueError("Invalid or missing input files")
                 
             # Vérifier uniquement si les fichiers sont lisibles en UTF-8
-            try:
-                with open(objective_filepath, 'r', encoding='utf-8') as f:
-                    f.read()
-                with open(agent_filepath, 'r', encoding='utf-8') as f:
-                    f.read()
-            except UnicodeDecodeError:
+            if not (self._is_utf8_file(objective_filepath) and self._is_utf8_file(agent_filepath)):
                 self.logger.warning(f"⚠️ Non-UTF-8 files detected, converting...")
                 self.encoding_utils.convert_to_utf8(objective_filepath)
                 self.encoding_utils.convert_to_utf8(agent_filepath)
@@ -89,7 +88,7 @@ class AiderManager:
                 model=model
             )
             
-            self.logger.debug(f"Aider command: {cmd}")
+            self.logger.debug("Aider command: %s", cmd)
 
             # Create process without encoding parameter
             process = await asyncio.create_subprocess_exec(
@@ -98,14 +97,18 @@ class AiderManager:
                 stderr=asyncio.subprocess.PIPE
             )
 
-            # Stream output in real-time with manual decoding
+            # Stream output in real-time with manual decoding (only decoded
+            # and formatted when debug output is enabled)
+            log_output = self.logger.is_enabled_for(logging.DEBUG)
             while True:
                 line = await process.stdout.readline()
                 if not line:
                     break
+                if not log_output:
+                    continue
                 try:
                     decoded_line = line.decode('utf-8', errors='replace').strip()
-                    self.logger.debug(f"AIDER: {decoded_line}")
+                    self.logger.debug("AIDER: %s", decoded_line)
                 except Exception as e:
                     self.logger.warning(f"Failed to decode output line: {str(e)}")
 
@@ -123,29 +126,24 @@ class AiderManager:
             # Check if any files were modified by looking for changes in git status
             modified_files = False
             try:
-                result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True, check=True)
-                modified_files = bool(result.stdout.strip())
+                status = await self._run_git('status', '--porcelain')
+                modified_files = bool(status.strip())
             except subprocess.CalledProcessError as e:
                 self.logger.warning(f"Could not check git status: {e}")
 
             # Get latest commit info if files were modified
             if modified_files:
                 try:
-                    result = subprocess.run(
-                        ['git', 'log', '-1', '--pretty=format:%h - %s'],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    if result.stdout:
-                        self.logger.success(f"🔨 Git commit: {result.stdout}")
+                    commit_info = await self._run_git('log', '-1', '--pretty=format:%h - %s')
+                    if commit_info:
+                        self.logger.success(f"🔨 Git commit: {commit_info}")
                 except subprocess.CalledProcessError as e:
                     self.logger.warning(f"Could not get commit info: {e}")
 
                 # Push changes to GitHub
                 try:
                     self.logger.info(f"🔄 Attempting to push changes...")
-                    subprocess.run(['git', 'push'], check=True, capture_output=True, text=True)
+                    await self._run_git('push')
                     self.logger.info(f"✨ Changes pushed successfully")
                 except subprocess.CalledProcessError as e:
                     # Just log info for push failures since remote might not be configured
@@ -155,6 +153,29 @@ class AiderManager:
             self.logger.error(f"Aider operation failed: {str(e)}")
             raise
             
+    async def _run_git(self, *args):
+        """Run a git command without blocking the event loop.
+        
+        Returns:
+            str: Decoded stdout of the command
+            
+        Raises:
+            subprocess.CalledProcessError: If git exits with a non-zero status
+        """
+        process = await asyncio.create_subprocess_exec(
+            'git', *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        stdout = stdout.decode('utf-8', errors='replace')
+        stderr = stderr.decode('utf-8', errors='replace')
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, ['git', *args], stdout, stderr
+            )
+        return stdout
+
     def fix_git_encoding(self):
         """Configure git to use UTF-8 for new commits."""
         try:
@@ -166,7 +187,8 @@ class AiderManager:
             self.logger.warning(f"⚠️ Could not configure git encoding: {str(e)}")
 
     def _validate_mission_file(self, mission_filepath):
-        """Validate that the mission file exists and is readable.
+        """
+        Validate that mission file exists and is readable.
         
         Args:
             mission_filepath (str): Path to mission file
@@ -194,34 +216,24 @@ class AiderManager:
             
         return True
 
-    def _validate_mission_file(self, mission_filepath):
-        """
-        Validate that mission file exists and is readable.
+    def _is_utf8_file(self, filepath):
+        """Check that a file decodes as UTF-8.
         
-        Args:
-            mission_filepath (str): Path to mission file
-            
-        Returns:
-            bool: True if file is valid, False otherwise
-            
-        Side Effects:
-            Logs error messages if validation fails
+        Files unchanged (same mtime and size) since their last successful
+        check are not read again.
         """
-        if not os.path.exists(mission_filepath):
-            self.logger.error("❌ Mission file not found!")
-            self.logger.info("\n📋 To start KinOS, you must:")
-            self.logger.info("   1. Either create a '.aider.mission.md' file in the current folder")
-            self.logger.info("   2. Or specify the path to your mission file with --mission")
-            self.logger.info("\n💡 Examples:")
-            self.logger.info("   kin run agents --generate")
-            self.logger.info("   kin run agents --generate --mission path/to/my_mission.md")
-            self.logger.info("\n📝 The mission file must contain your project description.")
-            return False
-        
-        if not os.access(mission_filepath, os.R_OK):
-            self.logger.error(f"❌ Cannot read mission file: {mission_filepath}")
+        st = os.stat(filepath)
+        file_key = (st.st_mtime, st.st_size)
+        if self._utf8_checked.get(filepath) == file_key:
+            return True
+            
+        try:
+            with open(filepath, 'rb') as f:
+                f.read().decode('utf-8')
+        except UnicodeDecodeError:
             return False
             
+        self._utf8_checked[filepath] = file_key
         return True
 
     def _validate_files(self, *filepaths):
@@ -234,10 +246,15 @@ class AiderManager:
             bool: True if all files are valid, False otherwise
         """
         for filepath in filepaths:
-            if not filepath or not os.path.exists(filepath):
+            # One stat answers both existence and file type
+            try:
+                st = os.stat(filepath) if filepath else None
+            except OSError:
+                st = None
+            if st is None:
                 self.logger.error(f"❌ Missing file: {filepath}")
                 return False
-            if not os.path.isfile(filepath) or not os.access(filepath, os.R_OK):
+            if not stat.S_ISREG(st.st_mode) or not os.access(filepath, os.R_OK):
                 self.logger.error(f"🚫 Cannot read file: {filepath}")
                 return False
         return True
@@ -287,11 +304,12 @@ class AiderManager:
         agent_name = os.path.basename(agent_filepath).replace('.aider.agent.', '').replace('.md', '')
         
         # Use python -m to execute aider as module
-        aider_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vendor', 'aider')
         cmd = ["python", "-m", "aider.main"]
         
-        # Add aider path to PYTHONPATH
-        os.environ["PYTHONPATH"] = aider_path + os.pathsep + os.environ.get("PYTHONPATH", "")
+        # Add aider path to PYTHONPATH (once, not on every command)
+        python_path = os.environ.get("PYTHONPATH", "")
+        if AIDER_VENDOR_PATH not in python_path.split(os.pathsep):
+            os.environ["PYTHONPATH"] = AIDER_VENDOR_PATH + os.pathsep + python_path
         
         # Add required aider arguments
         cmd.extend([
@@ -326,221 +344,6 @@ class AiderManager:
             
         return cmd
 
-    def _parse_commit_type(self, commit_msg):
-        """
-        Parse commit message to determine type and corresponding emoji.
-        
-        Returns:
-            tuple: (type, emoji)
-        """
-        try:
-            # Decode commit message if it's bytes
-            if isinstance(commit_msg, bytes):
-                commit_msg = commit_msg.decode('utf-8')
-                
-            # Fix potential encoding issues
-            commit_msg = commit_msg.encode('latin1').decode('utf-8')
-            
-            commit_types = {
-            # Core Changes
-            'feat': '✨',
-            'fix': '🐛',
-            'refactor': '♻️',
-            'perf': '⚡️',
-            
-            # Documentation & Style
-            'docs': '📚',
-            'style': '💎',
-            'ui': '🎨',
-            'content': '📝',
-            
-            # Testing & Quality
-            'test': '🧪',
-            'qual': '✅',
-            'lint': '🔍',
-            'bench': '📊',
-            
-            # Infrastructure
-            'build': '📦',
-            'ci': '🔄',
-            'deploy': '🚀',
-            'env': '🌍',
-            'config': '⚙️',
-            
-            # Maintenance
-            'chore': '🔧',
-            'clean': '🧹',
-            'deps': '📎',
-            'revert': '⏪',
-            
-            # Security & Data
-            'security': '🔒',
-            'auth': '🔑',
-            'data': '💾',
-            'backup': '💿',
-            
-            # Project Management
-            'init': '🎉',
-            'release': '📈',
-            'break': '💥',
-            'merge': '🔀',
-            
-            # Special Types
-            'wip': '🚧',
-            'hotfix': '🚑',
-            'arch': '🏗️',
-            'api': '🔌',
-            'i18n': '🌐'
-        }
-        
-            # Check if commit message starts with any known type
-            for commit_type, emoji in commit_types.items():
-                if commit_msg.lower().startswith(f"{commit_type}:"):
-                    return commit_type, emoji
-                    
-            # Default to other
-            return "other", "🔨"
-            
-        except UnicodeError as e:
-            self.logger.warning(f"⚠️ Encoding issue with commit message: {str(e)}")
-            return "other", "🔨"
-            
-        except UnicodeError as e:
-            self.logger.warning(f"⚠️ Encoding issue with commit message: {str(e)}")
-            return "other", "🔨"
-
-    def _get_git_file_states(self):
-        """Get dictionary of tracked files and their current hash."""
-        try:
-            # Get list of tracked files with their hashes
-            result = subprocess.run(
-                ['git', 'ls-files', '-s'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            file_states = {}
-            for line in result.stdout.splitlines():
-                # Format: <mode> <hash> <stage> <file>
-                parts = line.split()
-                if len(parts) >= 4:
-                    file_path = ' '.join(parts[3:])  # Handle filenames with spaces
-                    file_hash = parts[1]
-                    file_states[file_path] = file_hash
-                    
-            return file_states
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to get git file states: {str(e)}")
-            raise
-
-    def _get_modified_files(self, before_state, after_state):
-        """Compare before and after states to find modified files."""
-        modified_files = []
-        
-        # Check for modified files
-        for file_path, after_hash in after_state.items():
-            before_hash = before_state.get(file_path)
-            if before_hash != after_hash:
-                modified_files.append(file_path)
-                self.logger.debug(f"🔍 Detected change in {file_path}")
-                self.logger.debug(f"  Before hash: {before_hash}")
-                self.logger.debug(f"  After hash: {after_hash}")
-                self.logger.debug(f"📝 Modified file: {file_path}")
-        
-        return modified_files
-
-    async def _handle_post_aider(self, agent_name, before_state, after_state, phase_name):
-        """Handle all post-aider operations for a single phase."""
-        modified_files = self._get_modified_files(before_state, after_state)
-        if modified_files:
-            self.logger.info(f"📝 Agent {agent_name} {phase_name} phase modified {len(modified_files)} files")
-            
-            try:
-                # Always update visualization when files are modified
-                self.logger.info("🎨 Updating repository visualization...")
-                await self._vision_manager.generate_visualization()
-                self.logger.success("✨ Repository visualization updated")
-            except Exception as e:
-                self.logger.error(f"❌ Failed to update visualization: {str(e)}")
-                    
-        return modified_files
-
-    async def _run_aider_phase(self, cmd, agent_name, phase_name, phase_prompt):
-        """Run a single aider phase and handle its results."""
-        phase_start = time.time()
-        self.logger.info(f"{phase_name} Agent {agent_name} starting phase at {phase_start}")
-        
-        # Prepare command with phase-specific prompt
-        phase_cmd = cmd.copy()
-        phase_cmd[-1] = phase_cmd[-1] + f"\n{phase_prompt}"
-        
-        # Get initial state
-        initial_state = self._get_git_file_states()
-        
-        try:
-            # Execute aider with explicit UTF-8 encoding
-            process = subprocess.Popen(
-                phase_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                encoding='utf-8',
-                errors='replace'  # Handle encoding errors by replacing invalid chars
-            )
-            stdout, stderr = process.communicate()
-            
-            if process.returncode != 0:
-                self.logger.error(f"{phase_name} process failed with return code {process.returncode}")
-                raise subprocess.CalledProcessError(process.returncode, phase_cmd, stdout, stderr)
-
-            # Get final state and handle post-aider operations
-            final_state = self._get_git_file_states()
-            modified_files = await self._handle_post_aider(agent_name, initial_state, final_state, phase_name)
-        
-            # Get latest commit info if files were modified
-            if modified_files:
-                try:
-                    result = subprocess.run(
-                        ['git', 'log', '-1', '--pretty=format:%h - %s'],
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',  # Explicit UTF-8 encoding
-                        errors='replace',   # Replace invalid chars
-                        check=True
-                    )
-                    if result.stdout:
-                        # Ensure proper encoding of commit message
-                        commit_msg = result.stdout.encode('utf-8', errors='replace').decode('utf-8')
-                        self.logger.success(f"🔨 Git commit: {commit_msg}")
-                except subprocess.CalledProcessError as e:
-                    self.logger.warning(f"Could not get commit info: {e}")
-
-                # Push changes to GitHub
-                try:
-                    self.logger.info(f"🔄 Attempting to push changes...")
-                    subprocess.run(
-                        ['git', 'push'], 
-                        check=True, 
-                        capture_output=True, 
-                        text=True,
-                        encoding='utf-8',  # Explicit UTF-8 encoding
-                        errors='replace'    # Replace invalid chars
-                    )
-                    self.logger.info(f"✨ Changes pushed successfully")
-                except subprocess.CalledProcessError as e:
-                    # Just log info for push failures since remote might not be configured
-                    error_msg = e.stderr.encode('utf-8', errors='replace').decode('utf-8')
-                    self.logger.info(f"💡 Git push skipped: {error_msg.strip()}")
-        
-            phase_end = time.time()
-            self.logger.info(f"✨ Agent {agent_name} completed {phase_name} phase in {phase_end - phase_start:.2f} seconds")
-        
-            return modified_files, final_state
-            
-        except Exception as e:
-            self.logger.error(f"Error in {phase_name} phase for agent {agent_name}: {str(e)}")
-            raise
-
     def _generate_map_maintenance_prompt(self, tree_structure=None):
         """
         Generate map maintenance prompt for updating map.md.
@@ -611,77 +414,19 @@ Update map.md to reflect the current project structure while maintaining its for
 
     def _get_complete_tree(self):
         """Get complete tree structure without depth limit."""
-        fs_utils = FSUtils()
         current_path = "."
-        files = fs_utils.get_folder_files(current_path)
-        subfolders = fs_utils.get_subfolders(current_path)
-        return fs_utils.build_tree_structure(
+        files, subfolders = self.fs_utils.get_folder_entries(current_path)
+        return self.fs_utils.build_tree_structure(
             current_path=current_path,
             files=files,
             subfolders=subfolders,
             max_depth=None  # No depth limit
         )
 
-    async def _execute_aider(self, cmd):
-        """Execute aider command and handle results."""
-        try:
-            # Configure git to use UTF-8 for commit messages
-            subprocess.run(['git', 'config', 'i18n.commitEncoding', 'utf-8'], check=True)
-            subprocess.run(['git', 'config', 'i18n.logOutputEncoding', 'utf-8'], check=True)
-            
-            # Extract agent name from cmd arguments
-            agent_name = None
-            for i, arg in enumerate(cmd):
-                if "--chat-history-file" in arg and i+1 < len(cmd):
-                    agent_name = cmd[i+1].replace('.aider.history.', '').replace('.md', '')
-                    break
-
-            # Log start time
-            start_time = time.time()
-            self.logger.info(f"⏳ Agent {agent_name} starting aider execution at {start_time}")
-
-            # Run production phase
-            production_files, production_state = await self._run_aider_phase(
-                cmd, agent_name, "🏭 Production", 
-                "--> Focus on the Production Objective"
-            )
-
-            # Run role-specific phase
-            role_files, role_state = await self._run_aider_phase(
-                cmd, agent_name, "👤 Role-specific",
-                "--> Focus on the Role-specific Objective"
-            )
-
-            # Run final check phase
-            final_files, final_state = await self._run_aider_phase(
-                cmd, agent_name, "🔍 Final Check",
-                "--> Any additional changes required? Then update the todolist to reflect the changes."
-            )
-
-            # Get list of all modified/added/deleted files
-            all_changes = set()
-            all_changes.update(production_files or [])
-            all_changes.update(role_files or [])
-            all_changes.update(final_files or [])
-
-            # Log total duration and summary
-            total_duration = time.time() - start_time
-            self.logger.info(f"🎯 Agent {agent_name} completed total aider execution in {total_duration:.2f} seconds")
-            
-            if all_changes:
-                self.logger.info(f"📝 Agent {agent_name} modified total of {len(all_changes)} files")
-
-        except Exception as e:
-            agent_msg = f"Agent {agent_name} " if agent_name else ""
-            self.logger.error(f"💥 {agent_msg}aider execution failed: {str(e)}")
-            self.logger.error(f"Error type: {type(e).__name__}")
-            if hasattr(e, 'output'):
-                self.logger.error(f"Error output:\n{e.output}")
-            raise
     def run_map_maintenance_for_all_folders(self):
         """Run map maintenance for each folder in the repository."""
         self.logger.debug("Starting map maintenance for all folders...")
-        fs_utils = FSUtils()
+        fs_utils = self.fs_utils
         ignore_patterns = fs_utils._get_ignore_patterns()
 
         for root, dirs, _ in os.walk('.'):
@@ -701,12 +446,12 @@ Update map.md to reflect the current project structure while maintaining its for
         self.logger.debug(f"Running map maintenance for folder: {folder_path}")
         
         try:
-            # Get the COMPLETE tree structure starting from root
-            fs_utils = FSUtils()
+            # Get the COMPLETE tree structure starting from root, reusing the
+            # shared FSUtils so ignore patterns are not reloaded per folder
+            fs_utils = self.fs_utils
             fs_utils.set_current_folder(folder_path)  # Set current folder before building tree
         
-            root_files = fs_utils.get_folder_files(".")
-            root_subfolders = fs_utils.get_subfolders(".")
+            root_files, root_subfolders = fs_utils.get_folder_entries(".")
             tree_structure = fs_utils.build_tree_structure(
                 current_path=".",  # Start from root
                 files=root_files,
@@ -719,11 +464,10 @@ Update map.md to reflect the current project structure while maintaining its for
                 tree_structure=tree_structure
             )
             
-            self.logger.debug(f"Generated map maintenance prompt:\n{map_prompt}")
+            self.logger.debug("Generated map maintenance prompt:\n%s", map_prompt)
 
             # Execute aider with the generated prompt
-            aider_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vendor', 'aider')
-            cmd = ["python", os.path.join(aider_path, "aider")]
+            cmd = ["python", os.path.join(AIDER_VENDOR_PATH, "aider")]
             cmd.extend([
                 "--model", "gpt-4o-mini",
                 "--edit-format", "diff", 
@@ -744,7 +488,7 @@ Update map.md to reflect the current project structure while maintaining its for
             )
             stdout, stderr = process.communicate()
             
-            self.logger.debug(f"Aider response:\nSTDOUT:\n{stdout}\nSTDERR:\n{stderr}")
+            self.logger.debug("Aider response:\nSTDOUT:\n%s\nSTDERR:\n%s", stdout, stderr)
 
             if process.returncode != 0:
                 raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
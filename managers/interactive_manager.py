@@ -308,23 +308,22 @@ Process this objective to be more specific and actionable while maintaining alig
                 raise ValueError("No processed objective provided for file context analysis")
 
             # Get complete repository structure with actual files
-            fs_utils = FSUtils()
             files = []
-            for root, _, filenames in os.walk('.'):
-                # Skip .git folder but allow other dot files/folders
-                if '.git' not in root.split(os.sep):
-                    for filename in filenames:
-                        full_path = os.path.join(root, filename)
-                        rel_path = os.path.relpath(full_path, '.').replace(os.sep, '/')
-                        files.append(f"- ./{rel_path}")
+            for root, dirs, filenames in os.walk('.'):
+                # Skip .git folder without descending into it, but allow other dot files/folders
+                dirs[:] = [d for d in dirs if d != '.git']
+                # Resolve the relative folder once, not once per file
+                rel_root = os.path.relpath(root, '.').replace(os.sep, '/')
+                prefix = "- ./" if rel_root == '.' else f"- ./{rel_root}/"
+                for filename in filenames:
+                    files.append(prefix + filename)
 
             # Create tree text with all files
             tree_text = "\n".join(sorted(files)) if files else "No existing files"
             
-            self.logger.debug(f"\n🌳 Available files:\n{tree_text}")
+            self.logger.debug("\n🌳 Available files:\n%s", tree_text)
 
-            # Generate fresh visualization
-            await self.vision_manager.generate_visualization()
+            # Visualization was already refreshed at the start of the planning phase
 
             # Initialize messages list
             messages = [
@@ -1,11 +1,20 @@
 import os
+import re
 import requests
+import threading
+from collections import deque, OrderedDict
 from utils.logger import Logger
 from utils.encoding_utils import EncodingUtils
 from utils.fs_utils import FSUtils
 import openai
 from dotenv import load_dotenv
 
+# Maximum number of files kept in the objective read cache
+FILE_CACHE_MAX_ENTRIES = 32
+
+# First line of an objective that requests research, e.g. "Search: <query>"
+SEARCH_LINE_PATTERN = re.compile(r'^\s*Search:(.*)$', re.MULTILINE)
+
 class ObjectiveManager:
     """Manager class for generating agent-specific objectives."""
     
@@ -13,6 +22,9 @@ class ObjectiveManager:
         self.logger = Logger()
         self.encoding_utils = EncodingUtils()
         self.model = model
+        self._file_cache = OrderedDict()  # filepath -> (mtime, size, content), LRU order
+        self._file_cache_lock = threading.Lock()  # Objectives are generated from executor threads
+        self._client = None  # OpenAI client, created on first use
         load_dotenv()
         openai.api_key = os.getenv('OPENAI_API_KEY')
         if not openai.api_key:
@@ -39,25 +51,13 @@ class ObjectiveManager:
                 
             self.logger.info(f"🎯 Generating objective for agent: {agent_filepath}")
             
-            # Validate input files exist and are readable
-            if not os.path.exists(mission_filepath):
-                raise ValueError(f"Mission file not found: {mission_filepath}")
-                
-            if not os.path.exists(agent_filepath):
-                raise ValueError(f"Agent file not found: {agent_filepath}")
-                
-            if not os.access(mission_filepath, os.R_OK):
-                raise ValueError(f"Cannot read mission file: {mission_filepath}")
-                
-            if not os.access(agent_filepath, os.R_OK):
-                raise ValueError(f"Cannot read agent file: {agent_filepath}")
-                
             # Extract agent name from filepath
             agent_name = self._extract_agent_name(agent_filepath)
             
-            # Load content from files
-            mission_content = self._read_file(mission_filepath)
-            agent_content = self._read_file(agent_filepath)
+            # Load content from files; the read itself validates that they
+            # exist and are readable, so no separate exists/access probes
+            mission_content = self._read_input_file(mission_filepath, "mission")
+            agent_content = self._read_input_file(agent_filepath, "agent")
             
             # Generate objective via GPT
             objective = self._generate_objective_content(mission_content, agent_content, agent_name)
@@ -85,27 +85,62 @@ class ObjectiveManager:
         basename = os.path.basename(agent_filepath)
         return basename.replace('.aider.agent.', '').replace('.md', '')
 
+    def _read_input_file(self, filepath, kind):
+        """Read a required input file, raising ValueError if it is missing or unreadable."""
+        try:
+            return self._read_file(filepath)
+        except FileNotFoundError:
+            raise ValueError(f"{kind.capitalize()} file not found: {filepath}")
+        except PermissionError:
+            raise ValueError(f"Cannot read {kind} file: {filepath}")
+
+    def _get_client(self):
+        """Get the shared OpenAI client, creating it on first use."""
+        if self._client is None:
+            self._client = openai.OpenAI()
+        return self._client
 
     def _read_file(self, filepath):
-        """Read content from file with robust encoding handling."""
-        return self.encoding_utils.read_file_safely(filepath)
+        """Read content from file with robust encoding handling.
+        
+        Content is cached per path and reused while the file's mtime and
+        size are unchanged, so mission and agent files re-read on every
+        cycle only hit the disk when they have been edited.
+        """
+        stat = os.stat(filepath)
+        with self._file_cache_lock:
+            cached = self._file_cache.get(filepath)
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                self._file_cache.move_to_end(filepath)
+                return cached[2]
+            
+        content = self.encoding_utils.read_file_safely(filepath)
+        if content is not None:
+            with self._file_cache_lock:
+                self._file_cache[filepath] = (stat.st_mtime, stat.st_size, content)
+                self._file_cache.move_to_end(filepath)
+                # Evict least recently used files beyond the cache bound
+                while len(self._file_cache) > FILE_CACHE_MAX_ENTRIES:
+                    self._file_cache.popitem(last=False)
+        return content
 
     def _generate_objective_content(self, mission_content, agent_content, agent_name):
         """Generate objective content using GPT."""
         try:
-            client = openai.OpenAI()
+            client = self._get_client()
 
             # Build list of all file paths
             files = []
-            for root, _, filenames in os.walk('.'):
-                # Skip any folder that starts with .
-                if not any(part.startswith('.') for part in root.split(os.sep)[1:]):
-                    for filename in filenames:
-                        # Skip files that start with . or .aider
-                        if not (filename.startswith('.') or filename.startswith('.aider')):
-                            full_path = os.path.join(root, filename)
-                            rel_path = os.path.relpath(full_path, '.').replace(os.sep, '/')
-                            files.append(f"- ./{rel_path}")
+            for root, dirs, filenames in os.walk('.'):
+                # Skip any folder that starts with . without descending into it
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+                # Resolve the relative folder once, not once per file
+                rel_root = os.path.relpath(root, '.').replace(os.sep, '/')
+                prefix = "- ./" if rel_root == '.' else f"- ./{rel_root}/"
+                for filename in filenames:
+                    # Skip files that start with . (including .aider files)
+                    if not filename.startswith('.'):
+                        files.append(prefix + filename)
 
             # Create sorted list of paths
             tree_text = "\n".join(sorted(files)) if files else "No existing files"
@@ -115,8 +150,8 @@ class ObjectiveManager:
             if os.path.exists('suivi.md'):
                 try:
                     with open('suivi.md', 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        last_lines = lines[-80:] if len(lines) > 80 else lines
+                        # Bounded deque keeps only the tail while streaming the file
+                        last_lines = deque(f, maxlen=80)
                         suivi_content = ''.join(last_lines)
                 except Exception as e:
                     self.logger.warning(f"⚠️ Could not read suivi.md: {str(e)}")
@@ -194,10 +229,17 @@ Create two objectives in markdown format - one for production, one specific to y
 """
             #self.logger.info(f"OBJECTIVE PROMPT: {prompt}")
 
+            # Encode the diagram once; it is attached to both completions below
+            encoded_diagram = None
+            if diagram_content:
+                try:
+                    import base64
+                    encoded_diagram = base64.b64encode(diagram_content).decode('utf-8')
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Could not encode diagram: {str(e)}")
+
             # First get the main objective
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
+            messages = [
                     {"role": "system", "content": f"""
 # Context
 
@@ -233,7 +275,29 @@ Your planning:
 # System Prompt
 {agent_content}
 """}
-                ],
+            ]
+            if encoded_diagram:
+                messages.append({
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/png;base64,{encoded_diagram}"
+                            }
+                        },
+                        {
+                            "type": "text",
+                            "text": prompt
+                        }
+                    ]
+                })
+            else:
+                messages.append({"role": "user", "content": prompt})
+
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
                 temperature=0.5,
                 max_tokens=2000
             )
@@ -256,13 +320,9 @@ Project structure
 {tree_text}
 ````
 """
-            # Add diagram if available
-            if os.path.exists('./diagram.png'):
+            # Add diagram if available (already read above)
+            if encoded_diagram:
                 try:
-                    with open('./diagram.png', 'rb') as f:
-                        diagram_content = f.read()
-                    import base64
-                    encoded_bytes = base64.b64encode(diagram_content).decode('utf-8')
                     file_context_prompt = f"""
 [A visual diagram of the project structure is attached to help inform your decisions]
 
@@ -280,7 +340,7 @@ In this context, you are a precise file context analyzer for AI development task
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{encoded_bytes}"
+                                        "url": f"data:image/png;base64,{encoded_diagram}"
                                     }
                                 },
                                 {
@@ -303,7 +363,7 @@ In this context, you are a precise file context analyzer for AI development task
                 ]
 
             # Log the complete prompt being sent to GPT
-            self.logger.debug(f"File context prompt:\n{file_context_prompt}")
+            self.logger.debug("File context prompt:\n%s", file_context_prompt)
 
             # Add instructions to prompt
             file_context_prompt += """
@@ -339,7 +399,7 @@ Respond only with the file lists in the format shown above.
                 
                 file_context = file_context_response.choices[0].message.content.strip()
                 # Log the response received
-                self.logger.debug(f"File context response:\n{file_context}")
+                self.logger.debug("File context response:\n%s", file_context)
                 
                 # Add file context to objective
                 objective += "\n\n# Required Files\n" + file_context
@@ -348,43 +408,6 @@ Respond only with the file lists in the format shown above.
                 self.logger.warning(f"⚠️ Could not generate file context: {str(e)}")
                 # Continue without file context
 
-            # Initialize messages list
-            messages = []
-            
-            # Add diagram if available
-            if diagram_content:
-                try:
-                    import base64
-                    # Encode bytes to base64
-                    encoded_bytes = base64.b64encode(diagram_content).decode('utf-8')
-                    messages.append({
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{encoded_bytes}"
-                                }
-                            },
-                            {
-                                "type": "text",
-                                "text": "Above is the current project structure visualization. Use it to inform your objective planning."
-                            }
-                        ]
-                    })
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Could not encode diagram: {str(e)}")
-
-            # Add main prompt
-            messages.append({"role": "user", "content": prompt})
-
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-                temperature=0.5,
-                max_tokens=2000
-            )
-            
             return objective
             
         except Exception as e:
@@ -394,7 +417,7 @@ Respond only with the file lists in the format shown above.
     def _generate_summary(self, objective, agent_name, agent_content):
         """Generate a one-line summary of the objective."""
         try:
-            client = openai.OpenAI()
+            client = self._get_client()
             prompt = f'''
 Mission Context
 ================
@@ -445,7 +468,7 @@ In this context, you are an assistant who summarizes project actions in a concis
     def _generate_research_summary(self, query, result, agent_name, agent_content):
         """Generate a summary of the Perplexity research results."""
         try:
-            client = openai.OpenAI()
+            client = self._get_client()
             prompt = f'''
 Search Query 
 ================
@@ -505,13 +528,12 @@ In this context, you are an assistant who summarizes project actions in a concis
             # Extract agent name from filepath
             agent_name = os.path.basename(filepath).replace('.aider.objective.', '').replace('.md', '')
             
-            # Check for research requirement
-            if "Search:" in content:
+            # Check for research requirement and locate its line in one scan
+            search_match = SEARCH_LINE_PATTERN.search(content)
+            if search_match:
                 # Extract research query
-                research_lines = [line.strip() for line in content.split('\n') 
-                                if line.strip().startswith("Search:")]
-                if research_lines:
-                    research_query = research_lines[0].replace("Search:", "").strip()
+                research_query = search_match.group(1).replace("Search:", "").strip()
+                if research_query:
                     
                     # Call Perplexity API
                     perplexity_key = os.getenv('PERPLEXITY_API_KEY')
@@ -10,15 +10,41 @@ class VisionManager:
         """Initialize the vision manager."""
         self.logger = Logger(model=model)
         self.model = model
+        self._generation = None  # In-flight visualization task, if any
+        self._dirty = False  # Set when a caller arrives during a run
 
     async def generate_visualization(self):
         """
         Generate repository visualization using repo-visualizer.
         
+        Concurrent callers share the generation already in progress. A call
+        made while a run is in flight marks it dirty, so the shared task runs
+        once more after it finishes and every caller gets a diagram started
+        after its own call.
+        
         Raises:
             RuntimeError: If Node.js is not installed
             subprocess.CalledProcessError: If visualization generation fails
         """
+        if self._generation is None or self._generation.done():
+            self._generation = asyncio.ensure_future(self._run_generations())
+        else:
+            self.logger.debug("🎨 Visualization already in progress, queuing a refresh...")
+            self._dirty = True
+        # Shield the shared task so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(self._generation)
+
+    async def _run_generations(self):
+        """Generate the visualization, repeating while calls arrived during a run."""
+        self._dirty = False
+        result = await self._generate_visualization()
+        while self._dirty:
+            self._dirty = False
+            result = await self._generate_visualization()
+        return result
+
+    async def _generate_visualization(self):
+        """Run repo-visualizer and convert its SVG output to PNG."""
         try:
             # Validate Node.js installation quietly
             try:
@@ -1,10 +1,6 @@
 import sys
 import logging
 import asyncio
-from managers.agents_manager import AgentsManager
-from managers.objective_manager import ObjectiveManager
-from managers.aider_manager import AiderManager
-from managers.agent_runner import AgentRunner
 from utils.logger import Logger
 
 def main():
@@ -31,11 +27,13 @@ def main():
 
         subcommand = sys.argv[2]
         if subcommand == "map":
+            from managers.aider_manager import AiderManager
             manager = AiderManager()
             manager.logger.logger.setLevel(logging.DEBUG)  # Set log level to DEBUG
             manager.run_map_maintenance_for_all_folders()
             
         elif subcommand == "agents":
+            from managers.agents_manager import AgentsManager
             manager = AgentsManager(model=model)
             # Optional mission file path
             mission_path = sys.argv[3] if len(sys.argv) > 3 else ".aider.mission.md"
@@ -45,6 +43,7 @@ def main():
             from managers.vision_manager import VisionManager
             manager = VisionManager()
             asyncio.run(manager.generate_visualization())
+            from managers.objective_manager import ObjectiveManager
             manager = ObjectiveManager()
             
             # Parse arguments
@@ -69,12 +68,15 @@ def main():
             print("Options:")
             print("  --generate    Generate agents if missing")
             print("  --verbose     Show detailed debug information")
+            print("  --verbose-libs Also apply --verbose to library loggers (openai, httpx)")
             print("  --mission     Specify mission file path")
             print("  --model      Specify model to use (default: gpt-4o-mini)")
             sys.exit(1)
             
         subcommand = sys.argv[2]
         if subcommand == "agents":
+            from managers.agent_runner import AgentRunner
+            
             # Create and initialize runner asynchronously
             async def init_and_run_agents():
                 # Get model name
@@ -91,7 +93,8 @@ def main():
                 
                 # Set global log level based on verbose flag
                 if "--verbose" in sys.argv:
-                    Logger.set_global_level(logging.DEBUG)
+                    Logger.set_global_level(logging.DEBUG,
+                                            include_libraries="--verbose-libs" in sys.argv)
                 else:
                     Logger.set_global_level(logging.SUCCESS)
                     
@@ -142,6 +145,7 @@ def main():
             asyncio.run(init_and_run_agents())
             
         elif subcommand == "aider":
+            from managers.aider_manager import AiderManager
             manager = AiderManager()
             
             # Parse arguments
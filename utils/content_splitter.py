@@ -36,6 +36,9 @@ class ContentSplitter:
             'suivi.md', 
             'todolist.md'
         }
+        
+        # Cached .gitignore patterns as (mtime, patterns)
+        self._ignore_cache = None
 
     def _should_ignore(self, file_path):
         """
@@ -87,13 +90,24 @@ class ContentSplitter:
             list: List of gitignore patterns to exclude
             
         Note:
-            Ignores comment lines and empty lines in .gitignore
+            Ignores comment lines and empty lines in .gitignore.
+            Patterns are cached until the .gitignore mtime changes.
         """
+        try:
+            mtime = os.stat('.gitignore').st_mtime
+        except OSError:
+            mtime = None
+            
+        if self._ignore_cache is not None and self._ignore_cache[0] == mtime:
+            return self._ignore_cache[1]
+            
         patterns = []
-        if os.path.exists('.gitignore'):
+        if mtime is not None:
             with open('.gitignore', 'r') as f:
                 patterns.extend(line.strip() for line in f 
                               if line.strip() and not line.startswith('#'))
+                              
+        self._ignore_cache = (mtime, patterns)
         return patterns
 
     def _count_sections(self, content):
@@ -109,11 +123,7 @@ class ContentSplitter:
         Returns:
             int: Number of markdown sections found
         """
-        section_count = 0
-        for line in content.split('\n'):
-            if line.strip().startswith('#'):
-                section_count += 1
-        return section_count
+        return sum(line.lstrip().startswith('#') for line in content.split('\n'))
 
     def _count_paragraphs(self, content):
         """
@@ -128,9 +138,8 @@ class ContentSplitter:
         Returns:
             int: Number of non-empty paragraphs
         """
-        # Split on double newlines and filter empty paragraphs
-        paragraphs = [p.strip() for p in content.split('\n\n')]
-        return len([p for p in paragraphs if p])
+        # Split on double newlines and count non-empty paragraphs
+        return sum(1 for p in content.split('\n\n') if p and not p.isspace())
 
     def _needs_splitting(self, file_path):
         """
@@ -295,11 +304,6 @@ class ContentSplitter:
             with open(os.path.join(dir_path, "index.md"), 'w', encoding='utf-8') as f:
                 f.write('\n'.join(index_content))
                 
-            # Update global map
-            from managers.map_manager import MapManager
-            map_manager = MapManager()
-            map_manager.update_global_map(os.path.join(dir_path, "index.md"))
-            
             # Add split files to todolist
             self._update_todolist(dir_path, sections)
             
@@ -320,18 +324,16 @@ class ContentSplitter:
             if not os.path.exists(todolist_path):
                 return
                 
-            with open(todolist_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
-                
-            # Add new section for split files
-            new_content = current_content + "\n\n## Split Files Review\n"
+            # Build new section for split files
+            lines = ["\n\n## Split Files Review\n"]
             for i, section in enumerate(sections):
                 safe_title = section['title'].replace(' ', '_').lower()
                 file_name = f"{i+1:02d}_{safe_title}.md"
-                new_content += f"- [ ] Review and validate {os.path.join(dir_path, file_name)}\n"
+                lines.append(f"- [ ] Review and validate {os.path.join(dir_path, file_name)}\n")
                 
-            with open(todolist_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # Append instead of re-reading and rewriting the whole todolist
+            with open(todolist_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
                 
         except Exception as e:
             self.logger.error(f"Error updating todolist: {str(e)}")
@@ -1,4 +1,5 @@
 import os
+import re
 import fnmatch
 from pathlib import Path
 import mimetypes
@@ -30,6 +31,9 @@ class ContextBuilder:
             '.h', '.hpp', '.cs', '.vb', '.swift', '.r', '.scala',
             '.clj', '.ex', '.exs', '.erl', '.fs', '.fsx', '.dart'
         }
+        
+        # (pattern list, compiled regex) for the last ignore patterns used
+        self._ignore_regex = None
 
     def _get_ignore_patterns(self) -> List[str]:
         """
@@ -82,10 +86,31 @@ class ContextBuilder:
         Returns:
             bool: True if file should be ignored, False otherwise
         """
-        for pattern in ignore_patterns:
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-        return False
+        ignore_regex = self._get_ignore_regex(ignore_patterns)
+        return bool(ignore_regex and ignore_regex.match(os.path.normcase(file_path)))
+
+    def _get_ignore_regex(self, ignore_patterns: List[str]):
+        """
+        Compile ignore patterns into one regex, cached for the same pattern list.
+        
+        Equivalent to calling fnmatch.fnmatch with each pattern in turn.
+        
+        Args:
+            ignore_patterns (List[str]): List of glob patterns to compile
+            
+        Returns:
+            re.Pattern: Combined pattern, or None if there are no patterns
+        """
+        if self._ignore_regex is not None and self._ignore_regex[0] is ignore_patterns:
+            return self._ignore_regex[1]
+            
+        ignore_regex = None
+        if ignore_patterns:
+            ignore_regex = re.compile('|'.join(
+                fnmatch.translate(os.path.normcase(pattern)) for pattern in ignore_patterns
+            ))
+        self._ignore_regex = (ignore_patterns, ignore_regex)
+        return ignore_regex
 
     def _is_text_file(self, file_path: str) -> bool:
         """
@@ -1,8 +1,26 @@
 import os
+import re
 import fnmatch
 from typing import List, Set
 from utils.logger import Logger
 
+# Patterns always ignored, before .gitignore/.aiderignore entries
+DEFAULT_IGNORE_PATTERNS = (
+    '.git/*',
+    '.git*',
+    '.aider*',
+    'node_modules',
+    '__pycache__',
+    '*.pyc',
+    '*.pyo',
+    '*.pyd',
+    '.DS_Store',
+    'Thumbs.db'
+)
+
+# Project files whose entries extend the ignore patterns
+IGNORE_FILES = ('.gitignore', '.aiderignore')
+
 class FSUtils:
     """
     Utility class for file system operations and tree structure generation.
@@ -16,50 +34,57 @@ class FSUtils:
     
     def __init__(self):
         self.logger = Logger()
-        self.current_folder_path = None
+        self.current_folder_path = ""  # Empty means no active folder
+        self._ignore_cache = None  # (ignore file mtimes, patterns)
+        self._ignore_regex = None  # (patterns, compiled regex)
         
-    def get_folder_files(self, folder_path: str) -> list:
-        """Get list of files in folder, respecting ignore patterns."""
+    def get_folder_entries(self, folder_path: str) -> tuple:
+        """Get sorted (files, subfolders) of a folder in a single scan, respecting ignore patterns."""
         ignore_patterns = self._get_ignore_patterns()
         files = []
+        folders = []
         
-        for entry in os.scandir(folder_path):
-            if entry.is_file():
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                # DirEntry type checks reuse the directory listing, no extra stat
+                if entry.is_file():
+                    target = files
+                elif entry.is_dir():
+                    target = folders
+                else:
+                    continue
                 rel_path = os.path.relpath(entry.path, '.')
                 if not self._should_ignore(rel_path, ignore_patterns):
-                    files.append(entry.name)
+                    target.append(entry.name)
                     
-        return sorted(files)
+        return sorted(files), sorted(folders)
+
+    def get_folder_files(self, folder_path: str) -> list:
+        """Get list of files in folder, respecting ignore patterns."""
+        return self.get_folder_entries(folder_path)[0]
 
     def get_subfolders(self, folder_path: str) -> list:
         """Get list of subfolders, respecting ignore patterns."""
-        ignore_patterns = self._get_ignore_patterns()
-        folders = []
-        
-        for entry in os.scandir(folder_path):
-            if entry.is_dir():
-                rel_path = os.path.relpath(entry.path, '.')
-                if not self._should_ignore(rel_path, ignore_patterns):
-                    folders.append(entry.name)
-                    
-        return sorted(folders)
+        return self.get_folder_entries(folder_path)[1]
 
     def build_tree_structure(self, current_path: str, files: list, subfolders: list, 
                            max_depth: int = 3, current_depth: int = 0, 
-                           is_current_branch: bool = True) -> list:
-        """Build tree structure with proper indentation and active folder highlighting."""
-        tree = []
+                           is_current_branch: bool = True, tree: list = None) -> list:
+        """Build tree structure with proper indentation and active folder highlighting.
+        
+        Subfolder lines are appended to the same tree list through the recursion
+        rather than returned and copied into each parent.
+        """
+        if tree is None:
+            tree = []
         
-        # Initialize current_folder_path if None
-        if self.current_folder_path is None:
-            self.current_folder_path = ""
-            
         # Handle None max_depth by setting it to a large number
         if max_depth is None:
             max_depth = float('inf')  # Use infinity for unlimited depth
         
-        # Determine if this is the active folder
-        is_active = os.path.abspath(current_path) == self.current_folder_path
+        # Determine if this is the active folder (no path resolution when none is set)
+        is_active = (bool(self.current_folder_path) and
+                     os.path.abspath(current_path) == self.current_folder_path)
         
         # Show root folder without indentation
         if current_depth == 0:
@@ -88,19 +113,18 @@ class FSUtils:
                                   subfolder_path in self.current_folder_path)
             
             if is_current_subfolder or current_depth < max_depth:
-                sub_files = self.get_folder_files(subfolder_path)
-                sub_folders = self.get_subfolders(subfolder_path)
+                sub_files, sub_folders = self.get_folder_entries(subfolder_path)
                 
                 # Add subfolder and its contents
-                subtree = self.build_tree_structure(
+                self.build_tree_structure(
                     subfolder_path,
                     sub_files,
                     sub_folders,
                     max_depth,
                     current_depth + 1,
-                    is_current_subfolder
+                    is_current_subfolder,
+                    tree
                 )
-                tree.extend(subtree)
             else:
                 # Just show folder name for depth-limited branches
                 tree.append(f"{base_indent}{prefix}{d}/...")
@@ -108,40 +132,39 @@ class FSUtils:
         return tree
 
     def _get_ignore_patterns(self) -> List[str]:
-        """Get list of patterns to ignore from .gitignore and defaults."""
-        patterns = [
-            '.git/*',
-            '.git*',
-            '.aider*',
-            'node_modules',
-            '__pycache__',
-            '*.pyc',
-            '*.pyo',
-            '*.pyd',
-            '.DS_Store',
-            'Thumbs.db'
-        ]
+        """Get list of patterns to ignore from .gitignore and defaults.
         
-        # Add patterns from .gitignore if it exists
-        if os.path.exists('.gitignore'):
-            try:
-                with open('.gitignore', 'r', encoding='utf-8') as f:
-                    patterns.extend(line.strip() for line in f 
-                                  if line.strip() and not line.startswith('#'))
-            except Exception as e:
-                self.logger.warning(f"⚠️ Could not read .gitignore: {str(e)}")
+        The result is cached and rebuilt only when the mtime of .gitignore or
+        .aiderignore changes, since tree building asks for it once per folder.
+        """
+        cache_key = tuple(self._get_mtime(name) for name in IGNORE_FILES)
+        if self._ignore_cache is not None and self._ignore_cache[0] == cache_key:
+            return self._ignore_cache[1]
+            
+        patterns = list(DEFAULT_IGNORE_PATTERNS)
         
-        # Add patterns from .aiderignore if it exists        
-        if os.path.exists('.aiderignore'):
+        # Add patterns from .gitignore and .aiderignore if they exist
+        for ignore_file, mtime in zip(IGNORE_FILES, cache_key):
+            if mtime is None:
+                continue
             try:
-                with open('.aiderignore', 'r', encoding='utf-8') as f:
+                with open(ignore_file, 'r', encoding='utf-8') as f:
                     patterns.extend(line.strip() for line in f 
                                   if line.strip() and not line.startswith('#'))
             except Exception as e:
-                self.logger.warning(f"⚠️ Could not read .aiderignore: {str(e)}")
+                self.logger.warning(f"⚠️ Could not read {ignore_file}: {str(e)}")
                 
+        self._ignore_cache = (cache_key, patterns)
         return patterns
 
+    @staticmethod
+    def _get_mtime(path: str):
+        """Return the mtime of path, or None if it does not exist."""
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
     def _should_ignore(self, path: str, ignore_patterns: List[str]) -> bool:
         """Check if a path should be ignored based on ignore patterns."""
         # Normalize path for consistent comparison
@@ -152,11 +175,25 @@ class FSUtils:
         if any(part.startswith(('.git', '.aider')) for part in path_parts):
             return True
             
-        # Check against other ignore patterns
-        for pattern in ignore_patterns:
-            if fnmatch.fnmatch(path, pattern):
-                return True
-        return False
+        # Check against other ignore patterns in a single regex match
+        ignore_regex = self._get_ignore_regex(ignore_patterns)
+        return bool(ignore_regex and ignore_regex.match(os.path.normcase(path)))
+
+    def _get_ignore_regex(self, ignore_patterns: List[str]):
+        """Compile ignore patterns into one regex, cached for the same pattern list.
+        
+        Equivalent to calling fnmatch.fnmatch with each pattern in turn.
+        """
+        if self._ignore_regex is not None and self._ignore_regex[0] is ignore_patterns:
+            return self._ignore_regex[1]
+            
+        ignore_regex = None
+        if ignore_patterns:
+            ignore_regex = re.compile('|'.join(
+                fnmatch.translate(os.path.normcase(pattern)) for pattern in ignore_patterns
+            ))
+        self._ignore_regex = (ignore_patterns, ignore_regex)
+        return ignore_regex
 
     def set_current_folder(self, folder_path: str):
         """Set the current folder path for tree building."""
@@ -1,5 +1,10 @@
 import os
+import re
+import queue
+import atexit
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from colorama import init, Fore, Style
 import openai
 from dotenv import load_dotenv
@@ -8,23 +13,195 @@ from dotenv import load_dotenv
 logging.SUCCESS = 25  # Between INFO(20) and WARNING(30)
 logging.addLevelName(logging.SUCCESS, 'SUCCESS')
 
+# Map of agent types to emojis
+_AGENT_EMOJIS = {
+    'specification': '📌',
+    'management': '🧭', 
+    'writing': '🖋️',
+    'evaluation': '⚖️',
+    'deduplication': '👥',
+    'chronicler': '📜',
+    'redundancy': '🎭',
+    'production': '🏭',
+    'researcher': '🔬',
+    'integration': '🌐'
+}
+
+# Matches "agent <type>" with any casing of the prefix used in messages
+# ("agent", "Agent", "l'agent", "L'agent")
+_AGENT_NAME_PATTERN = re.compile(
+    r"([Aa]gent) (" + "|".join(map(re.escape, _AGENT_EMOJIS)) + r")"
+)
+
+# Maximum number of records waiting for the listener thread before new
+# records are dropped instead of blocking (or growing memory without bound)
+LOG_QUEUE_SIZE = 10000
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records while the queue is full.
+    
+    The number of dropped records is reported in a warning placed where the
+    gap occurred, as soon as the queue has room again.
+    """
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()  # Guards dropped across threads
+
+    def enqueue(self, record):
+        if self.dropped:
+            # Take the count under the lock so each drop is reported once
+            with self._dropped_lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                warning = logging.LogRecord(
+                    record.name, logging.WARNING, __file__, 0,
+                    "⚠️ %d log messages dropped (logging queue full)",
+                    (dropped,), None
+                )
+                try:
+                    self.queue.put_nowait(warning)
+                except queue.Full:
+                    # Still full: report these drops with the next gap
+                    with self._dropped_lock:
+                        self.dropped += dropped + 1
+                    return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room in a full bounded queue.
+    
+    The wait is bounded so a stuck listener cannot hang interpreter exit;
+    past it, queued records are discarded to make room for the sentinel.
+    """
+    
+    def enqueue_sentinel(self):
+        try:
+            self.queue.put(self._sentinel, timeout=5)
+            return
+        except queue.Full:
+            pass
+        while True:
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(self._sentinel)
+                return
+            except queue.Full:
+                continue
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once.
+    
+    Only valid for date formats without sub-second fields.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+class ColorFormatter(logging.Formatter):
+    """Console formatter that colors records by level."""
+    
+    FORMATS = {
+        logging.DEBUG: Fore.CYAN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.INFO: Fore.GREEN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.SUCCESS: Fore.BLUE + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.WARNING: Fore.YELLOW + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.ERROR: Fore.RED + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.CRITICAL: Fore.RED + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL
+    }
+
+    def __init__(self):
+        super().__init__()
+        # Build one formatter per level up front instead of one per record
+        self._formatters = {
+            level: CachedTimeFormatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
+            for level, log_fmt in self.FORMATS.items()
+        }
+        self._default_formatter = CachedTimeFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+
+    def format(self, record):
+        formatter = self._formatters.get(record.levelno, self._default_formatter)
+        return formatter.format(record)
+
 class Logger:
     """Utility class for handling logging operations."""
     
     # Class variable for global log level
     _global_level = logging.SUCCESS
     
+    # Mission file content shared by all instances as (mtime, content)
+    _mission_cache = None
+    
+    # Whether the shared KinOS logger handlers are set up in this process
+    _handlers_configured = False
+    
+    # Whether the process-wide console setup has run
+    _console_configured = False
+    
+    # Whether .env has been loaded and the OpenAI key checked
+    _openai_configured = False
+    
+    # Background listener writing queued records to the console and suivi.md
+    _listener = None
+    
+    # The listener's suivi.md handler, locked while suivi.md is read or swapped
+    _file_handler = None
+    
+    # Held while one thread summarizes suivi.md so others don't start a second run
+    _summary_lock = threading.Lock()
+    
     def __init__(self, model="gpt-4o-mini"):
-        """Initialize the logger with mission context."""
+        """Initialize the logger (mission context is loaded when logs are summarized)."""
         self.model = model
+        if not Logger._console_configured:
+            self._configure_console()
+            Logger._console_configured = True
+        
+        # Initialize OpenAI once per process; .env lookup walks up the
+        # directory tree, so later instances reuse the loaded key
+        if not Logger._openai_configured:
+            load_dotenv()
+            openai.api_key = os.getenv('OPENAI_API_KEY')
+            if not openai.api_key:
+                raise ValueError("OpenAI API key not found in environment variables")
+            Logger._openai_configured = True
+            
+        # Initialize suivi file path
+        self.suivi_file = 'suivi.md'
+
+        # Configure the shared KinOS logger once per process; later instances
+        # reuse its handlers instead of replacing (and leaking) them
+        self.logger = logging.getLogger('KinOS')
+        if not Logger._handlers_configured:
+            self._configure_handlers()
+            Logger._handlers_configured = True
+
+    @staticmethod
+    def _configure_console():
+        """Set up UTF-8 streams, locale and colorama once per process."""
         # Force UTF-8 for stdin/stdout
         import sys
         sys.stdin.reconfigure(encoding='utf-8')
         sys.stdout.reconfigure(encoding='utf-8')
 
-        # Load mission context
-        self.mission_content = self._load_mission_content()
-        
         # Set locale to UTF-8
         import locale
         try:
@@ -34,134 +211,128 @@ class Logger:
             
         # Initialize colorama for cross-platform color support
         init()
-        
-        # Add SUCCESS level between INFO and WARNING
-        logging.SUCCESS = 25  # Between INFO(20) and WARNING(30)
-        logging.addLevelName(logging.SUCCESS, 'SUCCESS')
-
-        # Initialize OpenAI
-        load_dotenv()
-        openai.api_key = os.getenv('OPENAI_API_KEY')
-        if not openai.api_key:
-            raise ValueError("OpenAI API key not found in environment variables")
-            
-        # Initialize suivi file path and handler
-        self.suivi_file = 'suivi.md'
-        file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
-                                         datefmt='%Y-%m-%d %H:%M:%S')
+
+    def _configure_handlers(self):
+        """Attach the console and suivi.md file handlers to the KinOS logger."""
+        file_formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s',
+                                             datefmt='%Y-%m-%d %H:%M:%S')
 
         # Initialize file handler with UTF-8 encoding
         file_handler = logging.FileHandler(self.suivi_file, encoding='utf-8', mode='a')
         file_handler.setFormatter(file_formatter)
         file_handler.setLevel(logging.SUCCESS)  # Only log SUCCESS and above
 
-        # Custom formatter with colors for console
-        class ColorFormatter(logging.Formatter):
-            FORMATS = {
-                logging.DEBUG: Fore.CYAN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.INFO: Fore.GREEN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.SUCCESS: Fore.BLUE + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.WARNING: Fore.YELLOW + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.ERROR: Fore.RED + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.CRITICAL: Fore.RED + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL
-            }
-
-            def format(self, record):
-                log_fmt = self.FORMATS.get(record.levelno)
-                formatter = logging.Formatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
-                return formatter.format(record)
-
-        # Setup console handler with color formatter and SUCCESS level by default
+        # Setup console handler with SUCCESS level by default, colored only when
+        # it writes to a terminal (pipes and redirects get plain lines)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.SUCCESS)  # Set default handler level to SUCCESS
-        console_handler.setFormatter(ColorFormatter())
+        if console_handler.stream.isatty():
+            console_handler.setFormatter(ColorFormatter())
+        else:
+            console_handler.setFormatter(file_formatter)
         
         # Configure logger with global level
-        self.logger = logging.getLogger('KinOS')
         self.logger.setLevel(self._global_level)
         
-        # Remove existing handlers and add our handlers
-        self.logger.handlers = []
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        # Close any existing handlers
+        for handler in self.logger.handlers[:]:
+            handler.close()
+            self.logger.removeHandler(handler)
+        
+        # Callers only enqueue records (never blocking: see
+        # DroppingQueueHandler); a background thread formats them and does
+        # the console and file I/O. Stopping the listener at exit drains
+        # the queue before logging shuts the handlers down.
+        log_queue = queue.Queue(LOG_QUEUE_SIZE)
+        Logger._file_handler = file_handler
+        Logger._listener = DrainingQueueListener(log_queue, console_handler, file_handler,
+                                                 respect_handler_level=True)
+        Logger._listener.start()
+        atexit.register(Logger._listener.stop)
+        self.logger.addHandler(DroppingQueueHandler(log_queue))
         
         # Set handler levels to match global level
-        for handler in self.logger.handlers:
+        for handler in self.logger.handlers + list(Logger._listener.handlers):
             handler.setLevel(self._global_level)
         
         # Prevent propagation to root logger
         self.logger.propagate = False
 
     @classmethod
-    def set_global_level(cls, level):
-        """Set the global logging level for all logger instances."""
+    def set_global_level(cls, level, include_libraries=False):
+        """Set the global logging level for all logger instances.
+        
+        Third-party loggers (openai, httpx, ...) keep their own levels unless
+        include_libraries is set, so they don't build DEBUG records by default.
+        """
         cls._global_level = level
-        # Update existing loggers
-        for logger in logging.Logger.manager.loggerDict.values():
-            if isinstance(logger, logging.Logger):
-                logger.setLevel(level)
-                for handler in logger.handlers:
-                    handler.setLevel(level)
+        if include_libraries:
+            loggers = [logger for logger in logging.Logger.manager.loggerDict.values()
+                       if isinstance(logger, logging.Logger)]
+        else:
+            loggers = [logging.getLogger('KinOS')]
+        for logger in loggers:
+            logger.setLevel(level)
+            for handler in logger.handlers:
+                handler.setLevel(level)
+        if cls._listener is not None:
+            for handler in cls._listener.handlers:
+                handler.setLevel(level)
+        
+    def is_enabled_for(self, level):
+        """Check whether messages at level would be logged.
         
+        Lets callers skip building expensive messages that would be dropped.
+        """
+        return self.logger.isEnabledFor(level)
+
     def _get_agent_emoji(self, text):
         """Parse text for agent names and add their emoji prefixes."""
-        # Map of agent types to emojis
-        agent_emojis = {
-            'specification': '📌',
-            'management': '🧭', 
-            'writing': '🖋️',
-            'evaluation': '⚖️',
-            'deduplication': '👥',
-            'chronicler': '📜',
-            'redundancy': '🎭',
-            'production': '🏭',
-            'researcher': '🔬',
-            'integration': '🌐'
-        }
-        
-        # Replace agent names with emoji prefixed versions
-        modified_text = text
-        for agent_type, emoji in agent_emojis.items():
-            # Look for agent name with various prefixes/formats
-            patterns = [
-                f"agent {agent_type}",
-                f"Agent {agent_type}",
-                f"l'agent {agent_type}",
-                f"L'agent {agent_type}"
-            ]
-            
-            for pattern in patterns:
-                modified_text = modified_text.replace(
-                    pattern, 
-                    f"{pattern[:pattern.index(agent_type)]}{emoji} {agent_type}"
-                )
-                
-        return modified_text
+        # Replace agent names with emoji prefixed versions in a single pass
+        return _AGENT_NAME_PATTERN.sub(
+            lambda m: f"{m.group(1)} {_AGENT_EMOJIS[m.group(2)]} {m.group(2)}",
+            text
+        )
 
-    def info(self, message):
-        """Log info level message in green with agent emoji if present."""
-        self.logger.info(self._get_agent_emoji(message))
+    def _format_message(self, message, args):
+        """Apply %-style args (if any) and agent emojis to a message."""
+        if args:
+            message = message % args
+        return self._get_agent_emoji(message)
+
+    def info(self, message, *args):
+        """Log info level message in green with agent emoji if present.
+        
+        Like the logging module, message is only %-formatted with args once
+        the level check passes.
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message(message, args))
         
-    def error(self, message):
+    def error(self, message, *args):
         """Log error level message in red with agent emoji if present."""
-        formatted_msg = self._get_agent_emoji(message)
-        self.logger.error(formatted_msg)
+        if self.logger.isEnabledFor(logging.ERROR):
+            formatted_msg = self._format_message(message, args)
+            self.logger.error(formatted_msg)
         
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log debug level message in cyan with agent emoji if present."""
-        formatted_msg = self._get_agent_emoji(message)
-        self.logger.debug(formatted_msg)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            formatted_msg = self._format_message(message, args)
+            self.logger.debug(formatted_msg)
         
-    def success(self, message):
+    def success(self, message, *args):
         """Log success level message in bright blue with agent emoji if present."""
-        formatted_msg = self._get_agent_emoji(message)
-        self.logger.log(logging.SUCCESS, formatted_msg)
-        self._check_and_summarize_logs()  # Check size after adding new log
+        if self.logger.isEnabledFor(logging.SUCCESS):
+            formatted_msg = self._format_message(message, args)
+            self.logger.log(logging.SUCCESS, formatted_msg)
+            self._check_and_summarize_logs()  # Check size after adding new log
         
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning level message in yellow with agent emoji if present."""
-        formatted_msg = self._get_agent_emoji(message)
-        self.logger.warning(formatted_msg)
+        if self.logger.isEnabledFor(logging.WARNING):
+            formatted_msg = self._format_message(message, args)
+            self.logger.warning(formatted_msg)
         
     def fix_file_encoding(self, filepath):
         """Convert file to UTF-8 if needed."""
@@ -191,36 +362,61 @@ class Logger:
                 self.logger.success(f"✅ Converted {filepath} from {encoding} to UTF-8")
         
     def _load_mission_content(self):
-        """Load mission content from .aider.mission.md file."""
+        """Load mission content from .aider.mission.md file.
+        
+        Loaded on demand when logs are summarized and cached across instances
+        until the file's mtime changes.
+        """
         try:
-            if os.path.exists('.aider.mission.md'):
-                with open('.aider.mission.md', 'r', encoding='utf-8') as f:
-                    return f.read()
-            return ""
+            try:
+                mtime = os.stat('.aider.mission.md').st_mtime
+            except FileNotFoundError:
+                return ""
+                
+            cache = Logger._mission_cache
+            if cache is not None and cache[0] == mtime:
+                return cache[1]
+                
+            with open('.aider.mission.md', 'r', encoding='utf-8') as f:
+                content = f.read()
+            Logger._mission_cache = (mtime, content)
+            return content
         except Exception as e:
-            print(f"Warning: Could not load mission file: {str(e)}")
+            self.logger.warning(f"⚠️ Could not load mission file: {str(e)}")
             return ""
 
     def _check_and_summarize_logs(self):
         """Check log file size and summarize if needed with mission context."""
+        summarizing = False
         try:
-            if not os.path.exists(self.suivi_file):
-                return
+            # Cheap size check first: a file of at most 25000 bytes cannot hold
+            # more than 25000 characters, so there is nothing to summarize and
+            # no need to touch the handler or read the file
+            try:
+                if os.path.getsize(self.suivi_file) <= 25000:
+                    return
+            except OSError:
+                return  # File does not exist
 
-            # First close the current handler
-            for handler in self.logger.handlers[:]:
-                if isinstance(handler, logging.FileHandler) and handler.baseFilename == os.path.abspath(self.suivi_file):
-                    handler.close()
-                    self.logger.removeHandler(handler)
+            # Only one summary at a time; other threads keep logging
+            if not Logger._summary_lock.acquire(blocking=False):
+                return
+            summarizing = True
             
-            # Try different encodings to read the file
+            # Read the raw bytes once under the handler lock, so no record is
+            # half-written, then try different encodings on them. The lock is
+            # not held during the GPT call: the listener keeps writing.
+            file_handler = Logger._file_handler
+            with file_handler.lock:
+                with open(self.suivi_file, 'rb') as f:
+                    raw = f.read()
+
             content = None
             encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
             
             for encoding in encodings:
                 try:
-                    with open(self.suivi_file, 'r', encoding=encoding) as f:
-                        content = f.read()
+                    content = raw.decode(encoding)
                     self.logger.debug(f"Successfully read file with {encoding} encoding")
                     break
                 except UnicodeDecodeError:
@@ -285,7 +481,7 @@ Format your summary in markdown with clear sections:
 - Next Steps"""},
                         {"role": "user", "content": f"""# Project Mission
 ````
-{self.mission_content}
+{self._load_mission_content()}
 ````
 
 # Recent Logs to Summarize
@@ -307,26 +503,25 @@ Create a detailed progress summary that shows how recent activities align with m
                 final_content += summary
                 final_content += "\n\n# Nouveaux logs\n\n"
                 
-                # Write new summary with utf-8 encoding
-                with open(self.suivi_file, 'w', encoding='utf-8') as f:
-                    f.write(final_content)
+                # Swap the new summary in atomically so an interrupted write
+                # never leaves a truncated suivi.md behind. Lines logged during
+                # the GPT call are carried over; the handler reopens the file
+                # on its next record.
+                temp_file = f"{self.suivi_file}.tmp"
+                with file_handler.lock:
+                    file_handler.close()
+                    with open(self.suivi_file, 'rb') as f:
+                        f.seek(len(raw))
+                        new_logs = f.read()
+                    with open(temp_file, 'wb') as f:
+                        f.write(final_content.encode('utf-8') + new_logs)
+                    os.replace(temp_file, self.suivi_file)
                     
                 self.logger.log(logging.SUCCESS, "✨ Mission tracking summarized successfully")
-            
-            # Re-add the file handler
-            file_handler = logging.FileHandler(self.suivi_file, encoding='utf-8', mode='a')
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
-                                             datefmt='%Y-%m-%d %H:%M:%S')
-            file_handler.setFormatter(file_formatter)
-            file_handler.setLevel(logging.SUCCESS)
-            self.logger.addHandler(file_handler)
                 
         except Exception as e:
             self.logger.error(f"⚠️ Error summarizing mission tracking: {str(e)}")
-            # Make sure we restore the file handler even if there's an error
-            file_handler = logging.FileHandler(self.suivi_file, encoding='utf-8', mode='a')
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
-                                             datefmt='%Y-%m-%d %H:%M:%S')
-            file_handler.setFormatter(file_formatter)
-            file_handler.setLevel(logging.SUCCESS)
-            self.logger.addHandler(file_handler)
+            
+        finally:
+            if summarizing:
+                Logger._summary_lock.release()